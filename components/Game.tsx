@@ -10,7 +10,7 @@ import { AnimatePresence } from 'framer-motion';
 import { Difficulty, GamePhase, UIState } from '@/types/game';
 import { DIFFICULTY_CONFIGS, INITIAL_LIVES } from '@/utils/constants';
 import { useAudio } from '@/hooks/useAudio';
-import { useHighScore } from '@/hooks/useHighScore';
+import { loadHighScores, useHighScore } from '@/hooks/useHighScore';
 import { GameCanvas } from './GameCanvas';
 import { HUD } from './HUD';
 import { StartScreen } from './StartScreen';
@@ -131,13 +131,8 @@ export function Game() {
 
   // Read all high scores from localStorage once
   useEffect(() => {
-    try {
-      const raw = localStorage.getItem('duck-hunt-highscores');
-      if (raw) {
-        const parsed = JSON.parse(raw) as Record<Difficulty, number>;
-        Object.assign(allHighScores, parsed);
-      }
-    } catch { /* ignore */ }
+    const stored = loadHighScores();
+    if (stored) Object.assign(allHighScores, stored);
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [screen]); // refresh when returning to start screen
 
@@ -14,11 +14,11 @@ import type { Difficulty, GamePhase } from '@/types/game';
 import {
   DIFFICULTY_CONFIGS, DUCK_COLORS, DUCK_HEIGHT, DUCK_POINTS,
   DUCK_TYPE_WEIGHTS, DUCK_WIDTH, FALL_GRAVITY, GROUND_HEIGHT,
-  INITIAL_LIVES, ROUND_END_DISPLAY_MS, ROUND_START_BANNER_MS,
-  SPEED_SCALE_PER_ROUND, STAR_COUNT,
+  INITIAL_LIVES, MAX_DEVICE_PIXEL_RATIO, ROUND_END_DISPLAY_MS,
+  ROUND_START_BANNER_MS, SPEED_SCALE_PER_ROUND, STAR_COUNT,
 } from '@/utils/constants';
 import {
-  drawSky, drawStars, drawClouds, drawGround,
+  drawSkyCached, drawStars, drawClouds, drawGroundCached,
   drawDuck, drawExplosion, drawScorePopup,
   drawMuzzleFlash, drawCrosshair, drawRoundBanner,
 } from '@/utils/renderer';
@@ -66,13 +66,27 @@ const uid = () => ++_id;
 
 // ─── Helper: pick a weighted random duck type ─────────────────────────────
 
+// Cumulative weight tables, built once per difficulty instead of walking
+// Object.entries() on every spawn
+const DUCK_TYPE_TABLES = Object.fromEntries(
+  Object.entries(DUCK_TYPE_WEIGHTS).map(([difficulty, weights]) => {
+    const types: DuckType[] = [];
+    const cumulative: number[] = [];
+    let acc = 0;
+    for (const [type, w] of Object.entries(weights)) {
+      acc += w;
+      types.push(type as DuckType);
+      cumulative.push(acc);
+    }
+    return [difficulty, { types, cumulative }];
+  })
+) as Record<Difficulty, { types: DuckType[]; cumulative: number[] }>;
+
 function pickDuckType(difficulty: Difficulty): DuckType {
-  const weights = DUCK_TYPE_WEIGHTS[difficulty];
+  const { types, cumulative } = DUCK_TYPE_TABLES[difficulty];
   const r = Math.random();
-  let acc = 0;
-  for (const [type, w] of Object.entries(weights)) {
-    acc += w;
-    if (r < acc) return type as DuckType;
+  for (let i = 0; i < cumulative.length; i++) {
+    if (r < cumulative[i]) return types[i];
   }
   return 'green';
 }
@@ -118,6 +132,17 @@ function spawnDuck(gd: GameData, canvasW: number, canvasH: number): Duck {
   };
 }
 
+// ─── Helper: in-place array compaction ───────────────────────────────────
+
+// Drops items failing `keep` without allocating a new array (unlike filter)
+function compactInPlace<T>(arr: T[], keep: (item: T) => boolean) {
+  let n = 0;
+  for (let i = 0; i < arr.length; i++) {
+    if (keep(arr[i])) arr[n++] = arr[i];
+  }
+  arr.length = n;
+}
+
 // ─── Helper: create explosion ─────────────────────────────────────────────
 
 function createExplosion(x: number, y: number, color: string): Explosion {
@@ -410,9 +435,8 @@ export function GameCanvas({
     });
 
     // ── Update ducks
-    const toRemove: number[] = [];
-    gd.ducks.forEach((d, i) => {
-      if (d.state === 'gone') { toRemove.push(i); return; }
+    gd.ducks.forEach(d => {
+      if (d.state === 'gone') return;
 
       // Flash timer
       if (d.flashTimer > 0) d.flashTimer--;
@@ -452,7 +476,6 @@ export function GameCanvas({
           if (gd.lives <= 0) {
             triggerGameOver(gd);
           }
-          toRemove.push(i);
           pushUI(gd);
           return;
         }
@@ -471,18 +494,15 @@ export function GameCanvas({
 
         if (d.y > groundY + 30 || d.opacity <= 0) {
           d.state = 'gone';
-          toRemove.push(i);
         }
       }
     });
 
-    // Remove dead/escaped ducks (iterate in reverse to preserve indices)
-    for (let i = toRemove.length - 1; i >= 0; i--) {
-      gd.ducks.splice(toRemove[i], 1);
-    }
+    // Remove dead/escaped ducks
+    compactInPlace(gd.ducks, d => d.state !== 'gone' && d.state !== 'escaped');
 
     // ── Update explosions
-    gd.explosions = gd.explosions.filter(e => e.opacity > 0.01);
+    compactInPlace(gd.explosions, e => e.opacity > 0.01);
     gd.explosions.forEach(e => {
       e.radius  += (e.maxRadius - e.radius) * 0.15;
       e.opacity -= 0.045;
@@ -493,11 +513,11 @@ export function GameCanvas({
         p.life++;
         p.opacity = 1 - p.life / p.maxLife;
       });
-      e.particles = e.particles.filter(p => p.opacity > 0);
+      compactInPlace(e.particles, p => p.opacity > 0);
     });
 
     // ── Update score popups
-    gd.scorePopups = gd.scorePopups.filter(s => s.opacity > 0.01);
+    compactInPlace(gd.scorePopups, s => s.opacity > 0.01);
     gd.scorePopups.forEach(s => {
       s.y  += s.vy;
       s.vy *= 0.95;
@@ -602,13 +622,14 @@ export function GameCanvas({
     gd: GameData,
     canvasW: number,
     canvasH: number,
+    dpr: number,
   ) => {
     ctx.clearRect(0, 0, canvasW, canvasH);
 
-    drawSky(ctx, canvasW, canvasH);
+    drawSkyCached(ctx, canvasW, canvasH, dpr);
     drawStars(ctx, gd.stars, gd.frameCount);
     drawClouds(ctx, gd.clouds);
-    drawGround(ctx, canvasW, canvasH);
+    drawGroundCached(ctx, canvasW, canvasH, dpr);
 
     gd.ducks.forEach(d => drawDuck(ctx, d));
     gd.explosions.forEach(e => drawExplosion(ctx, e));
@@ -630,10 +651,18 @@ export function GameCanvas({
     const ctx = canvas.getContext('2d');
     if (!ctx) return;
 
+    // Logical size is cached here so the loop doesn't force a layout read
+    // (getBoundingClientRect) several times per frame
+    let logicalW = 0;
+    let logicalH = 0;
+    let dpr = 1;
+
     // ── Resize handler
     const resize = () => {
-      const dpr = window.devicePixelRatio || 1;
+      dpr = Math.min(window.devicePixelRatio || 1, MAX_DEVICE_PIXEL_RATIO);
       const rect = canvas.getBoundingClientRect();
+      logicalW = rect.width;
+      logicalH = rect.height;
       canvas.width  = rect.width  * dpr;
       canvas.height = rect.height * dpr;
       ctx.scale(dpr, dpr);
@@ -643,11 +672,8 @@ export function GameCanvas({
     ro.observe(canvas);
     resize();
 
-    const logicalW = () => canvas.getBoundingClientRect().width;
-    const logicalH = () => canvas.getBoundingClientRect().height;
-
     // Init game data
-    gdRef.current = initGameData(initialDifficulty, logicalW(), logicalH());
+    gdRef.current = initGameData(initialDifficulty, logicalW, logicalH);
     const gd = gdRef.current;
 
     audio.startMusic();
@@ -667,10 +693,10 @@ export function GameCanvas({
       lastTs = ts;
 
       if (!isPausedRef.current) {
-        update(gd, dt, logicalW(), logicalH(), ts);
+        update(gd, dt, logicalW, logicalH, ts);
       }
 
-      render(ctx, gd, logicalW(), logicalH());
+      render(ctx, gd, logicalW, logicalH, dpr);
       rafRef.current = requestAnimationFrame(loop);
     };
 
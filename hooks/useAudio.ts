@@ -7,13 +7,39 @@ interface AudioState {
   musicEnabled: boolean;
 }
 
+// ─── Note tables (built once, shared by every call) ──────────────────────
+
+const COMBO_FREQS       = [440, 440 * 1.25, 440 * 1.5, 440 * 2, 440 * 2.5];
+const ROUND_START_NOTES = [523, 659, 784, 1047];
+const GAME_OVER_NOTES   = [440, 370, 311, 220];
+const MUSIC_MELODY      = [262, 294, 330, 349, 392, 349, 330, 294];
+
 // ─── Procedural sound helpers ─────────────────────────────────────────────
 
+// White-noise buffers are immutable once filled, so generate each duration
+// once per AudioContext and share it across every shot/miss
+const noiseBuffers = new WeakMap<AudioContext, Map<number, AudioBuffer>>();
+
+function noiseBuffer(ctx: AudioContext, duration: number): AudioBuffer {
+  let byDuration = noiseBuffers.get(ctx);
+  if (!byDuration) {
+    byDuration = new Map();
+    noiseBuffers.set(ctx, byDuration);
+  }
+
+  let buf = byDuration.get(duration);
+  if (!buf) {
+    const bufLen = Math.floor(ctx.sampleRate * duration);
+    buf = ctx.createBuffer(1, bufLen, ctx.sampleRate);
+    const data = buf.getChannelData(0);
+    for (let i = 0; i < bufLen; i++) data[i] = (Math.random() * 2 - 1);
+    byDuration.set(duration, buf);
+  }
+  return buf;
+}
+
 function noise(ctx: AudioContext, duration: number, gain: number): AudioBufferSourceNode {
-  const bufLen = Math.floor(ctx.sampleRate * duration);
-  const buf = ctx.createBuffer(1, bufLen, ctx.sampleRate);
-  const data = buf.getChannelData(0);
-  for (let i = 0; i < bufLen; i++) data[i] = (Math.random() * 2 - 1);
+  const buf = noiseBuffer(ctx, duration);
 
   const src = ctx.createBufferSource();
   src.buffer = buf;
@@ -131,9 +157,7 @@ export function useAudio() {
     const ctx = getCtx();
     if (!ctx) return;
 
-    const base = 440;
-    const freqs = [base, base * 1.25, base * 1.5, base * 2, base * 2.5];
-    const freq = freqs[Math.min(comboLevel - 1, freqs.length - 1)];
+    const freq = COMBO_FREQS[Math.min(comboLevel - 1, COMBO_FREQS.length - 1)];
 
     const osc = tone(ctx, freq, 0.2, 0.3, 'sine');
     osc.start();
@@ -152,8 +176,7 @@ export function useAudio() {
     const ctx = getCtx();
     if (!ctx) return;
 
-    const notes = [523, 659, 784, 1047];
-    notes.forEach((freq, i) => {
+    ROUND_START_NOTES.forEach((freq, i) => {
       const osc = tone(ctx, freq, 0.15, 0.25, 'square');
       osc.start(ctx.currentTime + i * 0.12);
       osc.stop(ctx.currentTime + i * 0.12 + 0.15);
@@ -166,8 +189,7 @@ export function useAudio() {
     const ctx = getCtx();
     if (!ctx) return;
 
-    const notes = [440, 370, 311, 220];
-    notes.forEach((freq, i) => {
+    GAME_OVER_NOTES.forEach((freq, i) => {
       const osc = tone(ctx, freq, 0.3, 0.3, 'sawtooth');
       osc.start(ctx.currentTime + i * 0.22);
       osc.stop(ctx.currentTime + i * 0.22 + 0.3);
@@ -187,7 +209,7 @@ export function useAudio() {
 
     // We'll drive the melody with a script processor–free approach:
     // encode a sequence of notes and cycle through them manually
-    const melody = [262, 294, 330, 349, 392, 349, 330, 294];
+    const melody = MUSIC_MELODY;
     let noteIdx = 0;
     const bpm = 120;
     const noteDur = (60 / bpm) * 0.5; // eighth notes
@@ -9,19 +9,23 @@ type HighScores = Record<Difficulty, number>;
 
 const DEFAULT_SCORES: HighScores = { easy: 0, medium: 0, hard: 0 };
 
+// Read persisted high scores; null if absent or unreadable
+export function loadHighScores(): HighScores | null {
+  try {
+    const stored = localStorage.getItem(STORAGE_KEY);
+    return stored ? (JSON.parse(stored) as HighScores) : null;
+  } catch {
+    return null;
+  }
+}
+
 export function useHighScore(difficulty: Difficulty) {
   const [scores, setScores] = useState<HighScores>(DEFAULT_SCORES);
 
   // Load from localStorage on mount
   useEffect(() => {
-    try {
-      const stored = localStorage.getItem(STORAGE_KEY);
-      if (stored) {
-        setScores(JSON.parse(stored) as HighScores);
-      }
-    } catch {
-      // ignore parse errors
-    }
+    const stored = loadHighScores();
+    if (stored) setScores(stored);
   }, []);
 
   const submitScore = useCallback(
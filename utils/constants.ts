@@ -4,6 +4,7 @@ import { Difficulty, GameConfig } from '@/types/game';
 export const CANVAS_BASE_WIDTH = 800;
 export const CANVAS_BASE_HEIGHT = 550;
 export const GROUND_HEIGHT = 110; // grass strip at bottom
+export const MAX_DEVICE_PIXEL_RATIO = 2; // cap backing-store resolution on high-DPR screens
 
 // Duck visual config
 export const DUCK_WIDTH = 52;
@@ -41,18 +41,19 @@ export function drawStars(
   stars: Star[],
   frame: number
 ) {
+  // Shared state is set once; only alpha and blur vary per star
+  ctx.save();
+  ctx.fillStyle = '#ffffff';
+  ctx.shadowColor = '#aaaaff';
   stars.forEach(star => {
     const twinkle = 0.5 + 0.5 * Math.sin(frame * star.twinkleSpeed + star.twinklePhase);
-    ctx.save();
     ctx.globalAlpha = 0.4 + 0.6 * twinkle;
-    ctx.fillStyle = '#ffffff';
     ctx.shadowBlur = 4 * twinkle;
-    ctx.shadowColor = '#aaaaff';
     ctx.beginPath();
     ctx.arc(star.x, star.y, star.radius, 0, Math.PI * 2);
     ctx.fill();
-    ctx.restore();
   });
+  ctx.restore();
 }
 
 export function drawClouds(
@@ -160,6 +161,68 @@ function drawTree(
   ctx.restore();
 }
 
+// ─── Static layer cache ─────────────────────────────────────────────────────
+
+// Sky and ground never change between frames, so each is painted once onto an
+// offscreen canvas at device resolution and blitted; repainted only on resize
+type LayerKey = 'sky' | 'ground';
+
+interface CachedLayer {
+  canvas: HTMLCanvasElement;
+  w: number;
+  h: number;
+  dpr: number;
+}
+
+const layerCache: Partial<Record<LayerKey, CachedLayer>> = {};
+
+function drawCachedLayer(
+  ctx: CanvasRenderingContext2D,
+  key: LayerKey,
+  w: number,
+  h: number,
+  dpr: number,
+  paint: (ctx: CanvasRenderingContext2D, w: number, h: number) => void
+) {
+  // drawImage() throws on a zero-sized source canvas
+  if (w <= 0 || h <= 0) return;
+
+  let layer = layerCache[key];
+  if (!layer || layer.w !== w || layer.h !== h || layer.dpr !== dpr) {
+    const canvas = document.createElement('canvas');
+    canvas.width  = w * dpr;
+    canvas.height = h * dpr;
+    const layerCtx = canvas.getContext('2d');
+    if (!layerCtx) {
+      paint(ctx, w, h);
+      return;
+    }
+    layerCtx.scale(dpr, dpr);
+    paint(layerCtx, w, h);
+    layer = { canvas, w, h, dpr };
+    layerCache[key] = layer;
+  }
+  ctx.drawImage(layer.canvas, 0, 0, w, h);
+}
+
+export function drawSkyCached(
+  ctx: CanvasRenderingContext2D,
+  w: number,
+  h: number,
+  dpr: number
+) {
+  drawCachedLayer(ctx, 'sky', w, h, dpr, drawSky);
+}
+
+export function drawGroundCached(
+  ctx: CanvasRenderingContext2D,
+  w: number,
+  h: number,
+  dpr: number
+) {
+  drawCachedLayer(ctx, 'ground', w, h, dpr, drawGround);
+}
+
 // ─── Duck ───────────────────────────────────────────────────────────────────
 
 export function drawDuck(ctx: CanvasRenderingContext2D, duck: Duck) {
@@ -282,17 +345,15 @@ export function drawExplosion(ctx: CanvasRenderingContext2D, explosion: Explosio
   ctx.arc(explosion.x, explosion.y, explosion.radius * 0.6, 0, Math.PI * 2);
   ctx.stroke();
 
-  // Particles
+  // Particles (drawn last, so the outer restore() covers their state)
+  ctx.shadowBlur = 8;
   explosion.particles.forEach(p => {
-    ctx.save();
     ctx.globalAlpha = p.opacity * explosion.opacity;
     ctx.fillStyle = p.color;
-    ctx.shadowBlur = 8;
     ctx.shadowColor = p.color;
     ctx.beginPath();
     ctx.arc(p.x, p.y, p.radius, 0, Math.PI * 2);
     ctx.fill();
-    ctx.restore();
   });
 
   ctx.restore();
@@ -412,14 +473,14 @@ export function drawRoundBanner(
   // Main text
   ctx.shadowBlur = 20;
   ctx.fillStyle = banner.color;
-  ctx.font = `bold ${Math.round(42 * banner.scale)}px "Courier New", monospace`;
+  ctx.font = bannerFont(Math.round(42 * banner.scale), true);
   ctx.textAlign = 'center';
   ctx.textBaseline = 'middle';
   ctx.fillText(banner.text, cx, cy - 14);
 
   // Sub text
   ctx.fillStyle = '#cccccc';
-  ctx.font = `${Math.round(18 * banner.scale)}px "Courier New", monospace`;
+  ctx.font = bannerFont(Math.round(18 * banner.scale), false);
   ctx.fillText(banner.subText, cx, cy + 22);
 
   ctx.restore();
@@ -427,6 +488,20 @@ export function drawRoundBanner(
 
 // ─── Helpers ────────────────────────────────────────────────────────────────
 
+// The banner pulses between a handful of integer font sizes, so the font
+// strings are built once per size rather than formatted on every frame
+const bannerFonts = new Map<number, string>();
+
+function bannerFont(px: number, bold: boolean): string {
+  const key = bold ? -px : px;
+  let font = bannerFonts.get(key);
+  if (!font) {
+    font = `${bold ? 'bold ' : ''}${px}px "Courier New", monospace`;
+    bannerFonts.set(key, font);
+  }
+  return font;
+}
+
 function roundRect(
   ctx: CanvasRenderingContext2D,
   x: number, y: number,